@@ -1,13 +1,14 @@
+import copy
 import inspect
+import re
 from functools import wraps
 from inspect import Parameter, Signature
 from pathlib import PurePath
-from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
-from flask import current_app, make_response, request
-from msgspec import EncodeError, ValidationError, convert
-from msgspec.json import Encoder
-from msgspec.json import decode as msgspec_json_decode
+from flask import Flask, Request, current_app, request
+from msgspec import EncodeError, Struct, ValidationError, convert, defstruct, field, structs
+from msgspec.json import Decoder, Encoder
 from werkzeug.wrappers import Response
 
 Empty = Signature.empty
@@ -16,6 +17,9 @@ ACCEPTED_PARAMS_KINDS = {
     Parameter.POSITIONAL_OR_KEYWORD,
     Parameter.KEYWORD_ONLY,
 }
+FORM_MIMETYPES = {"application/x-www-form-urlencoded", "multipart/form-data"}
+_MISSING_FIELD_RE = re.compile(r"^Object missing required field `(?P<key>\w+)`$")
+_ERROR_LOCATION_RE = re.compile(r"^(?P<msg>.*) - at `\$\.(?P<key>\w+)(?P<path>[^`]*)`$")
 
 
 def _dec_hook(type_: Type[Any], value: Any) -> Any:
@@ -34,13 +38,40 @@ def _enc_hook(obj: Any) -> Any:
 
 encoder = Encoder(enc_hook=_enc_hook)
 
+_missing_param_bodies: Dict[str, bytes] = {}
+
+_TUPLE_UNPACKERS: Dict[int, Callable[[Tuple[Any, ...]], Tuple[Any, Optional[int], Any]]] = {
+    2: lambda r: (r[0], r[1], None) if isinstance(r[1], int) else (r[0], None, r[1]),
+    3: lambda r: (r[0], r[1], r[2]),
+}
+
+
+def _error_message(ex: Exception) -> str:
+    return ex.args[0] if ex.args else ""
+
+
+def _error_body(error: str, detail: Dict[str, str]) -> bytes:
+    return encoder.encode({"error": error, "detail": detail})
+
+
+def _error_response(app: Flask, error: str, detail: Dict[str, str]) -> Response:
+    return app.response_class(_error_body(error, detail), status=400, mimetype="application/json")
+
+
+def _missing_param_response(app: Flask, key: str) -> Response:
+    body = _missing_param_bodies.get(key)
+    if body is None:
+        body = _error_body(ValidationError.__name__, {"key": key, "msg": "Missing"})
+        _missing_param_bodies[key] = body
+    return app.response_class(body, status=400, mimetype="application/json")
+
 
 def _build_param_type_map(
     signature: Signature,
-    kwargs: Dict[str, Any],
     namespace: Optional[Dict[str, Type[Any]]],
-):
+) -> Tuple[Dict[str, Type[Any]], Dict[str, Any]]:
     param_type_map: Dict[str, Type[Any]] = {}
+    param_default_map: Dict[str, Any] = {}
 
     for name, param in signature.parameters.items():
         if param.kind not in ACCEPTED_PARAMS_KINDS:
@@ -48,8 +79,7 @@ def _build_param_type_map(
         if param.annotation is Empty:
             raise TypeError(f"Type annonation is missing for `{name}` parameter")
 
-        if name not in kwargs:
-            kwargs[name] = param.default
+        param_default_map[name] = param.default
 
         if isinstance(param.annotation, str):
             type_ = None if namespace is None else namespace.get(param.annotation)
@@ -63,79 +93,90 @@ def _build_param_type_map(
             param_type_map[name] = type_
         else:
             param_type_map[name] = param.annotation
-    return param_type_map
+    return param_type_map, param_default_map
 
 
-def _convert_query_params(
-    kwargs: Dict[str, Any], param_type_map: Dict[str, Type[Any]]
-) -> Dict[str, Union[str, Dict[str, Any]]]:
-    for key, value in request.args.items():
-        if key not in kwargs:
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _build_params_struct(
+    param_type_map: Dict[str, Type[Any]], param_default_map: Dict[str, Any]
+) -> Optional[Type[Struct]]:
+    fields: List[Tuple[Any, ...]] = []
+    for name, type_ in param_type_map.items():
+        if name == "body":
             continue
-        try:
-            kwargs[key] = convert(value, type=param_type_map[key], strict=False, dec_hook=_dec_hook)
-        except ValidationError as ex:
-            return {"error": ValidationError.__name__, "detail": {"key": key, "msg": "".join(ex.args)}}
-    return {}
+        default = param_default_map[name]
+        if default is Empty:
+            fields.append((name, type_))
+        elif _is_hashable(default):
+            fields.append((name, type_, default))
+        else:
+            fields.append((name, type_, field(default_factory=lambda d=default: copy.copy(d))))
+    if not fields:
+        return None
+    return defstruct("_ParamsStruct", fields, kw_only=True)
 
 
-def _check_for_missing_query_params(kwargs: Dict[str, Any]) -> Optional[Dict[str, Union[str, Dict[str, Any]]]]:
-    for key, value in kwargs.items():
-        if key == "body":
-            continue
-        if value is Empty:
-            return {"error": ValidationError.__name__, "detail": {"key": key, "msg": "Missing"}}
-    return None
-
+def _validate_params(
+    app: Flask, params_struct: Type[Struct], req: Request, kwargs: Dict[str, Any]
+) -> Optional[Response]:
+    data: Dict[str, Any] = req.args.to_dict()
+    if req.view_args:
+        data.update(req.view_args)
 
-def _validate_path_params(
-    view_args: Dict[str, Any],
-    kwargs: Dict[str, Any],
-    param_type_map: Dict[str, Type[Any]],
-) -> Optional[Dict[str, Union[str, Dict[str, Any]]]]:
     try:
-        for name, value in view_args.items():
-            kwargs[name] = convert(value, type=param_type_map[name], strict=False, dec_hook=_dec_hook)
+        params = convert(data, type=params_struct, strict=False, dec_hook=_dec_hook)
     except ValidationError as ex:
-        return {"error": ValidationError.__name__, "detail": {"key": name, "msg": "".join(ex.args)}}  # type: ignore
+        msg = _error_message(ex)
+        if match := _MISSING_FIELD_RE.match(msg):
+            return _missing_param_response(app, match["key"])
+        if match := _ERROR_LOCATION_RE.match(msg):
+            msg = f"{match['msg']} - at `${match['path']}`" if match["path"] else match["msg"]
+            return _error_response(app, ValidationError.__name__, {"key": match["key"], "msg": msg})
+        return _error_response(app, ValidationError.__name__, {"msg": msg})
+
+    kwargs.update(structs.asdict(params))
+    return None
 
 
-def _validate_body(
-    body_data: Union[bytes, Dict[str, str]], kwargs: Dict[str, Any], param_type_map: Dict[str, Type[Any]]
-) -> Optional[Dict[str, Union[str, Dict[str, Any]]]]:
-    body_model = param_type_map.get("body", Empty)
-    if body_model is Empty:
-        raise ValueError("Expected a body model type")
+def _get_body_data(req: Request) -> Union[bytes, Dict[str, str]]:
+    if req.mimetype in FORM_MIMETYPES:
+        return req.form.to_dict()
+    return req.get_data() or {}
+
 
+def _validate_body(
+    app: Flask,
+    body_data: Union[bytes, Dict[str, str]],
+    kwargs: Dict[str, Any],
+    body_decoder: Decoder,
+) -> Optional[Response]:
     try:
-        if isinstance(body_data, bytes):
-            kwargs["body"] = msgspec_json_decode(body_data, type=body_model, strict=False, dec_hook=_dec_hook)
+        if type(body_data) is bytes:
+            kwargs["body"] = body_decoder.decode(body_data)
         else:
-            kwargs["body"] = convert(body_data, type=body_model, strict=False, dec_hook=_dec_hook)
+            kwargs["body"] = convert(body_data, type=body_decoder.type, strict=False, dec_hook=_dec_hook)
     except ValidationError as ex:
-        return {"error": ValidationError.__name__, "detail": {"key": "body", "msg": "".join(ex.args)}}
+        return _error_response(app, ValidationError.__name__, {"key": "body", "msg": _error_message(ex)})
+    return None
 
 
 def _unpack_result(result: Any) -> Tuple[Any, Optional[int], Any]:
-    response_value: Any = None
-    status_code: Optional[int] = None
-    headers: Any = None
-
-    if not isinstance(result, (tuple, Response)):
-        response_value = result
-    elif isinstance(result, tuple):
-        assert len(result) in {2, 3}  # noqa: S101
-        if len(result) == 2:
-            if isinstance(result[1], int):
-                response_value, status_code = result
-            else:
-                response_value, headers = result
-        elif len(result) == 3:
-            response_value, status_code, headers = result
-    else:
-        raise ValueError(f"Unhandled return type: {type(result)!r}")
-
-    return response_value, status_code, headers
+    if not isinstance(result, tuple):
+        if isinstance(result, Response):
+            raise ValueError(f"Unhandled return type: {type(result)!r}")
+        return result, None, None
+
+    unpacker = _TUPLE_UNPACKERS.get(len(result))
+    if unpacker is None:
+        raise ValueError(f"Unhandled return tuple length: {len(result)}")
+    return unpacker(result)
 
 
 def validate(
@@ -144,30 +185,29 @@ def validate(
     signature_namespace: Optional[Dict[str, Type[Any]]] = None,
 ):
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            sig = inspect.signature(func)
-            _return_model = return_model or sig.return_annotation
-            if _return_model is Empty:
-                raise TypeError("Missing return type")
+        sig = inspect.signature(func)
+        _return_model = return_model or sig.return_annotation
+        if _return_model is Empty:
+            raise TypeError("Missing return type")
 
-            param_type_map = _build_param_type_map(sig, kwargs, signature_namespace)
+        param_type_map, param_default_map = _build_param_type_map(sig, signature_namespace)
+        params_struct = _build_params_struct(param_type_map, param_default_map)
+        body_decoder = (
+            Decoder(param_type_map["body"], strict=False, dec_hook=_dec_hook) if "body" in param_type_map else None
+        )
 
-            if request.args and (error := _convert_query_params(kwargs, param_type_map)):
-                return error, 400
-
-            if error := _check_for_missing_query_params(kwargs):
-                return error, 400
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            app = current_app._get_current_object()
+            req = request._get_current_object()
 
-            if request.view_args and (error := _validate_path_params(request.view_args, kwargs, param_type_map)):
-                return error, 400
+            if params_struct is not None and (error := _validate_params(app, params_struct, req, kwargs)):
+                return error
 
-            if "body" in kwargs and (
-                error := _validate_body(request.data or request.form.to_dict(), kwargs, param_type_map)
-            ):
-                return error, 400
+            if body_decoder is not None and (error := _validate_body(app, _get_body_data(req), kwargs, body_decoder)):
+                return error
 
-            result = current_app.ensure_sync(func)(*args, **kwargs)
+            result = app.ensure_sync(func)(*args, **kwargs)
 
             response_value, _status_code, headers = _unpack_result(result)
             _status_code = _status_code or status_code
@@ -176,10 +216,9 @@ def validate(
                 response_value = convert(response_value, type=_return_model, strict=False, dec_hook=_dec_hook)
                 json_data = encoder.encode(response_value)
             except (ValidationError, EncodeError) as ex:
-                return {"error": type(ex).__name__, "detail": {"msg": "".join(ex.args)}}, 400
+                return _error_response(app, type(ex).__name__, {"msg": _error_message(ex)})
 
-            resp = make_response(json_data, _status_code)
-            resp.mimetype = "application/json"
+            resp = app.response_class(json_data, status=_status_code, mimetype="application/json")
 
             if headers:
                 resp.headers.update(headers)
@@ -0,0 +1,250 @@
+from typing import Any, Dict, List, NamedTuple, Set
+
+import msgspec
+import pytest
+from flask import Flask
+from werkzeug.routing import BaseConverter
+
+from flask_msgspec import core, validate
+
+
+class _MappingConverter(BaseConverter):
+    def to_python(self, value: str) -> Any:
+        return {"a": [value]}
+
+
+class _Inner(msgspec.Struct):
+    x: int
+
+
+class _Counter(msgspec.Struct):
+    count: int = 0
+
+
+class _Created(NamedTuple):
+    value: int
+    status: int
+
+
+class _Body(msgspec.Struct):
+    foo: int
+    name: str
+
+
+class _InnerConverter(BaseConverter):
+    def to_python(self, value: str) -> Any:
+        return {"y": value}
+
+
+def test_mutable_query_param_defaults(app: Flask) -> None:
+    @app.get("/")
+    @validate()
+    def handler(
+        tags: List[str] = ["x"],  # noqa: B006
+        mapping: Dict[str, int] = {"a": 1},  # noqa: B006
+        unique: Set[int] = {1},  # noqa: B006
+    ) -> dict:
+        tags.append("y")
+        return {"tags": tags, "mapping": mapping, "unique": sorted(unique)}
+
+    client = app.test_client()
+    for _ in range(2):
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.json == {"tags": ["x", "y"], "mapping": {"a": 1}, "unique": [1]}
+
+
+def test_mutable_struct_query_param_default(app: Flask) -> None:
+    @app.get("/")
+    @validate()
+    def handler(counter: _Counter = _Counter()) -> int:  # noqa: B008
+        counter.count += 1
+        return counter.count
+
+    client = app.test_client()
+    for _ in range(2):
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.json == 1
+
+
+def test_missing_query_param(app: Flask) -> None:
+    @app.get("/")
+    @validate()
+    def handler(q: float) -> float:
+        return q
+
+    response = app.test_client().get("/")
+    assert response.status_code == 400
+    assert response.json == {"error": "ValidationError", "detail": {"key": "q", "msg": "Missing"}}
+
+
+def test_invalid_query_param(app: Flask) -> None:
+    @app.get("/")
+    @validate()
+    def handler(q: float) -> float:
+        return q
+
+    response = app.test_client().get("/?q=x")
+    assert response.status_code == 400
+    assert response.json == {"error": "ValidationError", "detail": {"key": "q", "msg": "Expected `float`, got `str`"}}
+
+
+def test_invalid_nested_path_param(app: Flask) -> None:
+    app.url_map.converters["mapping"] = _MappingConverter
+
+    @app.get("/<mapping:m>")
+    @validate()
+    def handler(m: Dict[str, List[int]]) -> dict:
+        return m
+
+    response = app.test_client().get("/x")
+    assert response.status_code == 400
+    assert response.json == {
+        "error": "ValidationError",
+        "detail": {"key": "m", "msg": "Expected `int`, got `str` - at `$[...][0]`"},
+    }
+
+
+def test_missing_nested_field_in_path_param(app: Flask) -> None:
+    app.url_map.converters["inner"] = _InnerConverter
+
+    @app.get("/<inner:i>")
+    @validate()
+    def handler(i: _Inner) -> int:
+        return i.x
+
+    response = app.test_client().get("/x")
+    assert response.status_code == 400
+    assert response.json == {
+        "error": "ValidationError",
+        "detail": {"key": "i", "msg": "Object missing required field `x`"},
+    }
+
+
+def test_body_annotated_none(app: Flask) -> None:
+    @app.post("/")
+    @validate()
+    def handler(body: None) -> bool:
+        return body is None
+
+    response = app.test_client().post("/", data=b"null", content_type="application/json")
+    assert response.status_code == 200
+    assert response.json is True
+
+
+def test_named_tuple_result_is_unpacked(app: Flask) -> None:
+    @app.get("/")
+    @validate(return_model=int)
+    def handler():
+        return _Created(5, 201)
+
+    response = app.test_client().get("/")
+    assert response.status_code == 201
+    assert response.json == 5
+
+
+def test_error_response_bytes(app: Flask) -> None:
+    @app.get("/")
+    @validate(return_model=int)
+    def handler():
+        return "x"
+
+    response = app.test_client().get("/")
+    assert response.status_code == 400
+    assert response.mimetype == "application/json"
+    assert response.get_data() == b'{"error":"ValidationError","detail":{"msg":"Expected `int`, got `str`"}}'
+
+
+def test_form_body(app: Flask) -> None:
+    @app.post("/")
+    @validate()
+    def handler(body: _Body) -> dict:
+        return {"foo": body.foo, "name": body.name}
+
+    response = app.test_client().post("/", data={"foo": "3", "name": "n"})
+    assert response.status_code == 200
+    assert response.json == {"foo": 3, "name": "n"}
+
+
+def test_empty_body(app: Flask) -> None:
+    @app.post("/")
+    @validate()
+    def handler(body: _Body) -> dict:
+        return {"foo": body.foo, "name": body.name}
+
+    response = app.test_client().post("/")
+    assert response.status_code == 400
+    assert response.json == {
+        "error": "ValidationError",
+        "detail": {"key": "body", "msg": "Object missing required field `foo`"},
+    }
+
+
+def test_json_body(app: Flask) -> None:
+    @app.post("/")
+    @validate()
+    def handler(body: _Body) -> dict:
+        return {"foo": body.foo, "name": body.name}
+
+    client = app.test_client()
+    response = client.post("/", json={"foo": 1, "name": "n"})
+    assert response.status_code == 200
+    assert response.json == {"foo": 1, "name": "n"}
+
+    response = client.post("/", json={"foo": "x", "name": "n"})
+    assert response.status_code == 400
+    assert response.json == {
+        "error": "ValidationError",
+        "detail": {"key": "body", "msg": "Expected `int`, got `str` - at `$.foo`"},
+    }
+
+
+def test_tuple_results(app: Flask) -> None:
+    app.testing = True
+
+    @app.get("/status")
+    @validate(return_model=int)
+    def status():
+        return 1, 201
+
+    @app.get("/headers")
+    @validate(return_model=int)
+    def headers():
+        return 1, {"X-Test": "a"}
+
+    @app.get("/both")
+    @validate(return_model=int)
+    def both():
+        return 1, 202, {"X-Test": "b"}
+
+    @app.get("/too-long")
+    @validate(return_model=int)
+    def too_long():
+        return 1, 202, {}, None
+
+    client = app.test_client()
+    response = client.get("/status")
+    assert (response.status_code, response.headers.get("X-Test"), response.json) == (201, None, 1)
+    response = client.get("/headers")
+    assert (response.status_code, response.headers.get("X-Test"), response.json) == (200, "a", 1)
+    response = client.get("/both")
+    assert (response.status_code, response.headers.get("X-Test"), response.json) == (202, "b", 1)
+    with pytest.raises(ValueError, match="Unhandled return tuple length: 4"):
+        client.get("/too-long")
+
+
+def test_missing_param_body_is_cached(app: Flask) -> None:
+    @app.get("/")
+    @validate()
+    def handler(cached: int) -> int:
+        return cached
+
+    client = app.test_client()
+    expected = b'{"error":"ValidationError","detail":{"key":"cached","msg":"Missing"}}'
+    for _ in range(2):
+        response = client.get("/")
+        assert response.status_code == 400
+        assert response.mimetype == "application/json"
+        assert response.get_data() == expected
+    assert core._missing_param_bodies["cached"] == expected